@@ -9,4 +9,7 @@ class Defaults:
 	# Filtering
 	photon_min_default : int = 0
 	photon_max_default : int | None = None # None => unlimited
-	median_kernel_default : int = 1 # Has to be positive odd integer
\ No newline at end of file
+	median_kernel_default : int = 1 # Has to be positive odd integer
+	## --- Processing --- ##
+	# Threads used by phasorpy kernels. 0 => up to half of logical CPUs
+	num_threads : int = 0
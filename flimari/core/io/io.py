@@ -1,3 +1,4 @@
+import logging
 from pathlib import Path
 from typing import Any
 from phasorpy.io import (
@@ -5,6 +6,8 @@ from phasorpy.io import (
 	signal_from_imspector_tiff
 )
 
+logger = logging.getLogger(__name__)
+
 def load_signal(path:str|Path, channel:int=0) -> Any:
 	"""Load a FLIM dataset via phasorpy IO.
 
@@ -22,14 +25,13 @@ def load_signal(path:str|Path, channel:int=0) -> Any:
 			try:
 				sig = signal_from_imspector_tiff(p)
 			except ValueError as e:
-				print(".tiff/.tif files has to be of ImSpector origin due to metadata requirements.")
+				logger.warning(".tiff/.tif files has to be of ImSpector origin due to metadata requirements.")
 				raise
 		elif suffix == ".ptu":
 			sig = signal_from_ptu(p, frame=-1, channel=channel)
-			print(sig)
+			logger.debug("Loaded %s: dims=%s shape=%s", p.name, sig.dims, sig.shape)
 		else:
 			raise IOError(f"Unsupported extensions: {suffix}")
 		return sig
 	except Exception as e:
 		raise IOError(f"Failed to load {p}: {e}") from e
-
@@ -13,10 +13,16 @@ class LayerType(Enum):
 
 class LayerManager:
 	_instance = None
+	# Viewer method used to add each kind of layer
+	_ADD_DISPATCH = {
+		LayerType.IMAGE: "add_image",
+		LayerType.LABEL: "add_labels",
+	}
 
 	def __new__(cls, *arg, **kwarg):
 		if cls._instance is None:
 			cls._instance = super().__new__(cls)
+			cls._instance._initialized = False
 		return cls._instance
 
 	def __init__(self, viewer:Optional["napari.Viewer"]=None):
@@ -25,13 +31,21 @@ class LayerManager:
 		# Fortunately, it is clear the LayerManager will always be created in shell.
 		# Since every module will be using it.
 		if viewer:
+			# Keep the layer index in sync when layers are removed with napari's built-in UI.
+			# Connect once per viewer, so re-opening the plugin does not stack duplicate handlers.
+			if getattr(self, "viewer", None) is not viewer:
+				viewer.layers.events.removed.connect(self._on_layer_removed)
 			self.viewer = viewer
-			# TODO: Wire events
+		# __init__ runs on every LayerManager() call, only set up state once
+		if self._initialized: return
+		self._initialized = True
 		# Stores a nested dictionary containing the ndarray for layer
 		# Keyed by:
 		#	name: associated file name
 		#	kind: the kind of layer this is
 		self.layer_data = {}
+		# Layers added by the manager, keyed by (name, kind)
+		self._layer_index: Dict[Tuple[str, LayerType], "napari.layers.Layer"] = {}
 
 	## ------ Public API ------ ##
 	def add_layer(
@@ -55,7 +69,11 @@ class LayerManager:
 			# If no layer exists, add as new layer
 			self._add_layer(data, name=name, kind=kind, display_name=display_name, **kwargs)
 		elif overwrite:
-			layer.data = data
+			if layer.data is data:
+				# Same buffer, possibly updated in place. Refresh without resetting the layer data.
+				layer.refresh()
+			else:
+				layer.data = data
 			# If it is label layer, we need to update colormap as well
 			if kind == LayerType.LABEL:
 				cmap = kwargs.pop("colormap", None)
@@ -77,6 +95,12 @@ class LayerManager:
 		l1 = self.layer_data.get(name)
 		return None if l1 is None else l1.get(kind)
 
+	def has_layer(self, name:str, kind:LayerType) -> bool:
+		"""
+		Return whether a layer for <name,kind> currently exists in the viewer.
+		"""
+		return self._find_layer(name, kind) is not None
+
 	def focus_on_layers(self, name:str) -> None:
 		"""
 		Make only layers with metadata containing the given name visible.
@@ -95,6 +119,7 @@ class LayerManager:
 		# and then uses the plugin buttons in data row.
 		if layer is not None:
 			self.viewer.layers.remove(layer)
+		self._forget_layer(name, kind)
 
 	## ------ Internal ------ ##
 	def _make_tag(self, name:str, kind:LayerType) -> dict:
@@ -108,15 +133,39 @@ class LayerManager:
 
 	def _find_layer(self, name:str, kind:LayerType) -> "napari.layers.Layer":
 		"""
-		Iterate through all layers and find first that has matching metadata.
+		Return the indexed layer for <name,kind>.
+		On index miss, iterate through all layers and find first that has matching metadata.
 		"""
+		layer = self._layer_index.get((name, kind))
+		if layer is not None:
+			return layer
 		for lyr in self.viewer.layers:
 			meta = getattr(lyr, "metadata", {})
 			fs = meta.get("flimstudio")
 			if fs and fs.get("name") == name and fs.get("kind") == kind:
+				self._layer_index[(name, kind)] = lyr
 				return lyr
 		return None
 
+	def _on_layer_removed(self, event) -> None:
+		"""
+		Drop the index entry and stored data of a removed layer.
+		"""
+		meta = getattr(event.value, "metadata", {})
+		fs = meta.get("flimstudio")
+		if fs:
+			self._forget_layer(fs.get("name"), fs.get("kind"))
+
+	def _forget_layer(self, name:str, kind:LayerType) -> None:
+		"""
+		Drop everything the manager holds for <name,kind>, so removed layers do not pin their data.
+		"""
+		self._layer_index.pop((name, kind), None)
+		l1 = self.layer_data.get(name)
+		if l1 is not None:
+			l1.pop(kind, None)
+			if not l1: del self.layer_data[name]
+
 	def _add_layer(self, data:np.ndarray, *, name:str, kind:LayerType, display_name:str, **kwargs) -> None:
 		"""
 		Helper function for add_layer. Performs the actual layer adding.
@@ -126,8 +175,6 @@ class LayerManager:
 		# If display name is empty, default to name
 		display_name = display_name or name
 		# Add layer
-		match kind:
-			case LayerType.IMAGE:
-				self.viewer.add_image(data, name=display_name, metadata=tag, **kwargs)
-			case LayerType.LABEL:
-				self.viewer.add_labels(data, name=display_name, metadata=tag, **kwargs)
+		add = getattr(self.viewer, self._ADD_DISPATCH[kind])
+		layer = add(data, name=display_name, metadata=tag, **kwargs)
+		self._layer_index[(name, kind)] = layer
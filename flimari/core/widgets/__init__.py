@@ -1,4 +1,5 @@
 from .auto_spin_box import AutoDoubleSpinBox
+from .focus_spin_box import FocusSpinBox, FocusDoubleSpinBox
 from .themed_button import ThemedButton
 from .color_button import ColorButton
 from .indicator import Indicator
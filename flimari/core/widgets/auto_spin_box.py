@@ -1,6 +1,6 @@
 from typing import Optional
 
-from qtpy.QtCore import Signal
+from qtpy.QtCore import Signal, Slot
 from qtpy.QtGui import QPalette, QColor
 from qtpy.QtWidgets import (
 	QWidget,
@@ -11,6 +11,8 @@ from qtpy.QtWidgets import (
 	QStyle
 )
 
+from .focus_spin_box import FocusDoubleSpinBox
+
 # HACK: Standarize and collect at same place
 COLOR_SUCCESS = "#004411"
 COLOR_FAILURE = "#440000"
@@ -35,6 +37,8 @@ class AutoDoubleSpinBox(QWidget):
 		self.cached_value:float = 0.0
 		self._overridden:bool = False
 		self._has_cached:bool = True
+		# Background color currently applied to the spinbox, "" for the default style
+		self._current_bg:str = ""
 
 		self._build()
 
@@ -44,7 +48,7 @@ class AutoDoubleSpinBox(QWidget):
 		layout.setContentsMargins(0, 0, 0, 0)
 		layout.setSpacing(6)
 
-		self._spin = QDoubleSpinBox()
+		self._spin = FocusDoubleSpinBox()
 		self._spin.setRange(-1e9, 1e9)
 		self._spin.setSingleStep(0.01)
 		self._spin.setValue(0.0)
@@ -103,6 +107,7 @@ class AutoDoubleSpinBox(QWidget):
 			self.reset_button.setEnabled(True)
 			self._apply_bg(COLOR_SUCCESS)
 
+	@Slot()
 	def reset_to_cached(self) -> None:
 		"""Reset to the cached detected value (if present)."""
 		if not self._has_cached: return
@@ -118,13 +123,21 @@ class AutoDoubleSpinBox(QWidget):
 		return self._btn_reset
 
 	## ------ Internals ------ ##
+	@Slot(float)
 	def _on_value_changed(self, val:float) -> None:
-		_overridden = True
+		# Still showing the cached value, nothing to restyle or report
+		if self._has_cached and not self._overridden and val == self.cached_value: return
+		self._overridden = True
 		self._apply_bg(COLOR_OVERRIDDEN)
 		self.valueChanged.emit(val)
 
 	def _apply_bg(self, color_hex: str) -> None:
+		# Setting a stylesheet re-parses it and repolishes the widget, skip if nothing changes
+		if color_hex == self._current_bg: return
+		self._current_bg = color_hex
 		self._spin.setStyleSheet(f"QDoubleSpinBox {{ background: {color_hex}; }}")
 
 	def _reset_bg(self) -> None:
+		if not self._current_bg: return
+		self._current_bg = ""
 		self._spin.setStyleSheet("")
\ No newline at end of file
@@ -0,0 +1,32 @@
+from qtpy.QtCore import Qt
+from qtpy.QtWidgets import QSpinBox, QDoubleSpinBox
+
+class FocusSpinBox(QSpinBox):
+	"""
+	A QSpinBox that only reacts to the mouse wheel when it has keyboard focus.
+	Otherwise the wheel event is passed on, so scrolling a dock does not silently change values.
+	"""
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		# Wheel focus would grab focus on hover-scroll and defeat the check below
+		self.setFocusPolicy(Qt.StrongFocus)
+
+	def wheelEvent(self, event) -> None:
+		if not self.hasFocus():
+			event.ignore()
+			return
+		super().wheelEvent(event)
+
+class FocusDoubleSpinBox(QDoubleSpinBox):
+	"""
+	QDoubleSpinBox counterpart of FocusSpinBox.
+	"""
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		self.setFocusPolicy(Qt.StrongFocus)
+
+	def wheelEvent(self, event) -> None:
+		if not self.hasFocus():
+			event.ignore()
+			return
+		super().wheelEvent(event)
@@ -32,6 +32,12 @@ class Indicator(QFrame):
 		}
 		# current state name
 		self._state_name: str = "off"
+		# Stylesheet per state, built once so state changes only swap strings
+		r = self._diameter // 2
+		self._stylesheets: dict[str, str] = {
+			name: f"QFrame{{background:{color}; border-radius:{r}px}}"
+			for name, color in {**self._states, "off": self._off_color}.items()
+		}
 
 		self.setFixedSize(self._diameter, self._diameter)
 		self.setStyleSheet("")
@@ -59,6 +65,4 @@ class Indicator(QFrame):
 			self.stateChanged.emit(self._state_name)
 
 	def _apply(self) -> None:
-		color = self._off_color if self._state_name == "off" else self._states[self._state_name]
-		r = self._diameter // 2
-		self.setStyleSheet(f"QFrame{{background:{color}; border-radius:{r}px}}")
\ No newline at end of file
+		self.setStyleSheet(self._stylesheets[self._state_name])
\ No newline at end of file
@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from functools import lru_cache
 
 from qtpy.QtGui import QIcon
 from qtpy.QtWidgets import (
@@ -9,6 +10,16 @@ from qtpy.QtWidgets import (
 if TYPE_CHECKING:
 	import napari
 
+@lru_cache(maxsize=32)
+def _themed_icon(theme:str, name:str) -> QIcon:
+	"""
+	Return the napari resource icon for a theme, loaded once and shared.
+	QIcon is implicitly shared, so all buttons can hold the same instance.
+	"""
+	icon = QIcon()
+	icon.addFile(f"theme_{theme}:/{name}.svg", mode=QIcon.Normal, state=QIcon.Off)
+	return icon
+
 class ThemedButton(QPushButton):
 	"""
 	A QPushButton with napari built-in icons that follows viewer theme change.
@@ -23,6 +34,4 @@ class ThemedButton(QPushButton):
 
 	def _apply_icons(self):
 		theme = getattr(self.viewer, "theme", "dark")
-		icon = QIcon()
-		icon.addFile(f"theme_{theme}:/{self.icon}.svg", mode=QIcon.Normal, state=QIcon.Off)
-		self.setIcon(icon)
\ No newline at end of file
+		self.setIcon(_themed_icon(theme, self.icon))
\ No newline at end of file
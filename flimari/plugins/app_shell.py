@@ -2,17 +2,10 @@ from typing import TYPE_CHECKING
 
 from qtpy.QtWidgets import (
 	QWidget,
-	QHBoxLayout,
 	QVBoxLayout,
-	QLabel,
-	QPushButton,
-	QFormLayout,
-	QSpinBox,
-	QDoubleSpinBox,
-	QGroupBox
 )
-from qtpy.QtCore import Qt
-import numpy as np
+# NOTE: Kept as a runtime import, napari matches this annotation to inject the viewer.
+# napari is already imported by the time the plugin is loaded, so this costs nothing.
 from napari import Viewer
 
 from flimari.config.defaults import Defaults
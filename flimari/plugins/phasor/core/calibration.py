@@ -1,68 +1,99 @@
 from pathlib import Path
+from typing import TYPE_CHECKING
 import numpy as np
 from phasorpy.phasor import phasor_from_signal, phasor_center, phasor_transform
 from phasorpy.lifetime import phasor_from_lifetime, polar_from_reference_phasor
 
+from flimari.config import Defaults
 from flimari.core.io import load_signal
 
+if TYPE_CHECKING:
+	import xarray
+
 class Calibration:
 	def __init__(self) -> None:
 		self.path: str|Path = "" # Path to reference
-		self.signal = None # Reference signal
+		self.attrs: dict = {} # Reference signal metadata
 		self.ref_mean = None # Reference signal intensities
 		self.ref_real = None # Reference signal real component (g)
 		self.ref_imag = None # Reference signal imaginary component (s)
+		self.ref_center_real = None # Reference phasor center real component
+		self.ref_center_imag = None # Reference phasor center imaginary component
 
 		# Laser frequency of used for calibration
 		# (not necessarily from metadata, may be set by user)
 		self.frequency: float = 0.0
 		self.phase_zero: float = 0.0 # phi calibration
 		self.modulation_zero: float = 1.0 # m calibration
+		# Calibration results keyed by (frequency, lifetime)
+		self._cache: dict[tuple[float,float], tuple[float,float]] = {}
 
 	def load(self, path:str|Path, channel:int=0) -> None:
 		"""
 		Load reference signals.
+		Only the reference phasor and signal metadata are kept, not the raw signal.
 		"""
-		self.signal = load_signal(path, channel)
+		signal = load_signal(path, channel)
 		self.path = path
+		self.attrs = dict(signal.attrs)
+		# The reference phasor does not depend on frequency or lifetime,
+		# so compute it once per loaded reference.
+		self._compute_reference(signal)
 
 	def calibrate(self, frequency, lifetime) -> None:
-		if self.signal is None:
+		if self.ref_center_real is None:
 			raise ValueError("Reference signal is None")
 		# Store frequency used for calibration
 		self.frequency = frequency
-		# Compute phasor coordinates
-		self.ref_mean, self.ref_real, self.ref_imag = phasor_from_signal(self.signal, axis='H')
-
-		# NOTE: This thing is supposed to take numpy universal args, but doesn't take keepdims?
-		self.phase_zero, self.modulation_zero = polar_from_reference_phasor(
-			*phasor_center(
-				self.ref_mean,
-				self.ref_real,
-				self.ref_imag,
-			)[1:],
-			*phasor_from_lifetime(
-				frequency,
-				lifetime,
-			),
-		)
+		key = (frequency, lifetime)
+		if key not in self._cache:
+			# NOTE: This thing is supposed to take numpy universal args, but doesn't take keepdims?
+			self._cache[key] = polar_from_reference_phasor(
+				self.ref_center_real,
+				self.ref_center_imag,
+				*phasor_from_lifetime(
+					frequency,
+					lifetime,
+				),
+			)
+		self.phase_zero, self.modulation_zero = self._cache[key]
 
 	def compute_calibrated_phasor(self, real, imag):
 		"""
 		Transform the given phasor coordinates using self.phase_zero and self.modulation_zero.
-		Returns the transformed real and imaginary components.
+		Returns the transformed real and imaginary components with the same dtype as the input.
 		"""
-		return phasor_transform(real, imag, self.phase_zero, self.modulation_zero)
+		real_c, imag_c = phasor_transform(real, imag, self.phase_zero, self.modulation_zero)
+		# phasor_transform ignores dtype for scalar phase and modulation, which is always the case here
+		return real_c.astype(real.dtype, copy=False), imag_c.astype(real.dtype, copy=False)
 
 	def get_signal_attribute(self, attr:str):
 		"""
 		Return the signal attribute (if exists) or None.
 		"""
-		return self.signal.attrs.get(attr, None)
+		return self.attrs.get(attr, None)
 
 	def get_calibration(self):
 		"""
 		Return the phase and modulation shift.
 		For now, only handles the 2D case.
 		"""
-		return self.phase_zero, self.modulation_zero
\ No newline at end of file
+		return self.phase_zero, self.modulation_zero
+
+	## ------ Internal ------ ##
+	def _compute_reference(self, signal:"xarray.DataArray") -> None:
+		"""
+		Compute the reference phasor coordinates and their center.
+		This invalidates all cached calibration results.
+		"""
+		self.ref_mean, self.ref_real, self.ref_imag = phasor_from_signal(
+			signal,
+			axis='H',
+			num_threads=Defaults.num_threads
+		)
+		_, self.ref_center_real, self.ref_center_imag = phasor_center(
+			self.ref_mean,
+			self.ref_real,
+			self.ref_imag,
+		)
+		self._cache.clear()
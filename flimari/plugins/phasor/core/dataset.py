@@ -12,6 +12,7 @@ from phasorpy.lifetime import (
 	phasor_to_lifetime_search,
 )
 
+from flimari.config import Defaults
 from flimari.core.io import load_signal
 from flimari.core.utils import str2color
 
@@ -19,10 +20,14 @@ if TYPE_CHECKING:
 	import xarray
 
 class Dataset:
-	__slots__ = ("path", "name", "channel", "signal", "frequency", "counts", "counts_filtered",
+	__slots__ = ("path", "name", "channel", "frequency", "counts", "counts_filtered",
 		"mean", "real_raw", "imag_raw", "real_calibrated", "imag_calibrated", "g", "s",
 		"phase_lifetime", "modulation_lifetime", "normal_lifetime", "geo_lifetime", "geo_fraction", "avg_lifetime",
-		"max_count", "min_count", "kernel_size", "repetition", "mask", "group", "color")
+		"max_count", "min_count", "kernel_size", "repetition", "mask", "valid_idx", "group", "color",
+		"data_version", "_filter_key", "_median_key", "_median_cache", "_values_cache")
+	# Number of median filter results kept per dataset.
+	# Each entry holds two (2,Y,X) arrays, so keep just enough to toggle between two settings.
+	_MEDIAN_CACHE_SIZE = 2
 
 	def __init__(self, path:str|Path, channel:int):
 		if not os.path.isfile(path):
@@ -31,22 +36,34 @@ class Dataset:
 		self.path: str|Path = path
 		self.name: str = os.path.basename(path)
 		self.channel: int = channel
-		self.signal: "xarray.DataArray" = load_signal(path, channel)
+		# NOTE: The raw signal is only needed to derive the attributes below.
+		# It is deliberately not kept on the dataset, so it is freed once construction finishes.
+		signal: "xarray.DataArray" = load_signal(path, channel)
 
 		# Derived attributes
-		self.counts: np.ndarray = self._photon_sum() # Sum of photon counts over H axis
+		self.counts: np.ndarray = self._photon_sum(signal) # Sum of photon counts over H axis
 		self.counts_filtered: np.ndarray = self.counts.copy() # Photon counts but filtered with threshold
 		# Raw immutable phasor attributes
-		self.mean, self.real_raw, self.imag_raw = phasor_from_signal(self.signal, axis='H', harmonic=[1,2])
+		# float32 is plenty for photon-count derived phasors and halves memory traffic downstream
+		self.mean, self.real_raw, self.imag_raw = phasor_from_signal(
+			signal,
+			axis='H',
+			harmonic=[1,2],
+			dtype=np.float32,
+			num_threads=Defaults.num_threads
+		)
 		# Last seen frequency (MHz)
-		self.frequency: float = self.signal.attrs.get("frequency", 80)
+		self.frequency: float = signal.attrs.get("frequency", 80)
 		self.frequency = self.frequency if self.frequency > 0 else 80
 		# Calibrated phasors
-		self.real_calibrated: np.ndarray = self.real_raw.copy()
-		self.imag_calibrated: np.ndarray = self.imag_raw.copy()
-		# Working data copy
-		self.g: np.ndarray = self.real_calibrated.copy()
-		self.s: np.ndarray = self.imag_calibrated.copy()
+		# NOTE: Until calibration and filtering are applied, these share memory with the raw phasor.
+		# This is safe because both replace the arrays instead of writing into them, and
+		# apply_photon_mask never writes into g and s while they alias the calibrated phasor.
+		self.real_calibrated: np.ndarray = self.real_raw
+		self.imag_calibrated: np.ndarray = self.imag_raw
+		# Working data
+		self.g: np.ndarray = self.real_calibrated
+		self.s: np.ndarray = self.imag_calibrated
 		# Compute apprent and normal lifetimes
 		self.compute_lifetime_estimates()
 
@@ -55,8 +72,20 @@ class Dataset:
 		self.max_count: int = 10000
 		self.kernel_size: int = 3
 		self.repetition: int = 0
+		# Incremented whenever working data and lifetimes are recomputed, so views can skip redundant refreshes
+		self.data_version: int = 0
+		# Finite pixel values per (metric, harmonic), cleared whenever data_version changes
+		self._values_cache: dict[tuple[str,int], np.ndarray] = {}
+		# Filter parameters of the last apply_filters run, None if working data is stale
+		self._filter_key: tuple|None = None
+		# Median filter parameters behind the current working data, None if the filter is off
+		self._median_key: tuple|None = None
+		# Unmasked median filtered (g, s) keyed by (kernel_size, repetition), least recently used first
+		self._median_cache: dict[tuple[int,int], tuple[np.ndarray,np.ndarray]] = {}
 		# Cached photon count thresholding mask
-		self.mask = np.ones_like(self.mean, dtype=np.uint8)
+		self.mask = np.ones(self.mean.shape, dtype=bool)
+		# Cached flat indices of plottable pixels
+		self.update_valid_index()
 
 		# Misc attributes
 		self.group: str = "default"
@@ -68,58 +97,134 @@ class Dataset:
 		if calibration and calibration.frequency > 0:
 			self.frequency = calibration.frequency
 		# Every time we re-calibrate, re-compute working data
+		self._median_cache.clear()
+		self._filter_key = None
 		self.apply_filters()
 
 	def compute_lifetime_estimates(self) -> None:
 		"""
 		Compute and cache lifetime estimates.
 		"""
-		self.phase_lifetime, self.modulation_lifetime = phasor_to_apparent_lifetime(*self.get_phasor(), frequency=self.frequency)
-		self.normal_lifetime = phasor_to_normal_lifetime(*self.get_phasor(), frequency=self.frequency)
-		self.geo_lifetime, self.geo_fraction = phasor_to_lifetime_search(self.g, self.s, frequency=self.frequency)
-		self.avg_lifetime = (self.geo_lifetime*self.geo_fraction).sum(axis=0)
+		g, s = self.get_phasor()
+		phase_lifetime, modulation_lifetime = phasor_to_apparent_lifetime(g, s, frequency=self.frequency)
+		normal_lifetime = phasor_to_normal_lifetime(g, s, frequency=self.frequency)
+		geo_lifetime, geo_fraction = phasor_to_lifetime_search(self.g, self.s, frequency=self.frequency)
+		# Lifetime maps are displayed and summarized, float32 is plenty and halves layer uploads.
+		# No-op if phasorpy already returned float32 for our float32 phasor.
+		self.phase_lifetime = phase_lifetime.astype(np.float32, copy=False)
+		self.modulation_lifetime = modulation_lifetime.astype(np.float32, copy=False)
+		self.normal_lifetime = normal_lifetime.astype(np.float32, copy=False)
+		self.geo_lifetime = geo_lifetime.astype(np.float32, copy=False)
+		self.geo_fraction = geo_fraction.astype(np.float32, copy=False)
+		# Fraction weighted sum over components, without materializing the (2,Y,X) product
+		self.avg_lifetime = np.einsum("i...,i...->...", self.geo_lifetime, self.geo_fraction)
 		#DEBUG
-		self.avg_lifetime[self.avg_lifetime>10] = np.nan
+		np.putmask(self.avg_lifetime, self.avg_lifetime>10, np.nan)
 
 	## ------ Working functions ------ ##
 	def apply_filters(self) -> None:
-		self.reset_gs()
-		self.apply_median_filter()
+		"""
+		Re-compute working data and lifetimes from the calibrated phasor.
+		Skipped if the filter parameters and calibration are unchanged since the last run.
+		"""
+		key = (self.min_count, self.max_count, self.kernel_size, self.repetition)
+		if key == self._filter_key: return
+		median_key = (self.kernel_size, self.repetition) if self._median_enabled() else None
+		prev_mask = self.mask
 		self.update_photon_mask()
+		# Parameters can change without changing the working data, e.g. a new kernel size while
+		# the filter is off, or a threshold no pixel crosses. Then g, s and the lifetimes are still valid.
+		if (
+			self._filter_key is not None
+			and median_key == self._median_key
+			and np.array_equal(prev_mask, self.mask)
+		):
+			self._filter_key = key
+			return
+		# The median filter resets g and s itself
+		self.apply_median_filter()
 		self.apply_photon_mask()
 		# We always update lifetime estimates to keep everything in sync
 		self.compute_lifetime_estimates()
+		self._median_key = median_key
+		self._filter_key = key
+		self.data_version += 1
+		self._values_cache.clear()
 
 	def apply_median_filter(self) -> None:
 		"""
-		Apply median filter to g and s.
+		Apply median filter to the calibrated phasor and store the result in g and s.
+		If the filter is disabled, g and s are simply reset to the calibrated phasor.
+		Results are cached per (kernel_size, repetition) until the next calibration
+		or until the filter is disabled.
 		"""
-		if self.kernel_size < 3: return
-		if self.repetition < 1: return
-		_, self.g, self.s = phasor_filter_median(self.mean, self.g, self.s, repeat=self.repetition, size=self.kernel_size)
+		if not self._median_enabled():
+			self._median_cache.clear()
+			self.reset_gs()
+			return
+		key = (self.kernel_size, self.repetition)
+		cached = self._median_cache.pop(key, None)
+		if cached is None:
+			# phasorpy returns new arrays, so there is no need to copy the calibrated phasor first
+			_, g, s = phasor_filter_median(
+				self.mean,
+				self.real_calibrated,
+				self.imag_calibrated,
+				repeat=self.repetition,
+				size=self.kernel_size,
+				num_threads=Defaults.num_threads
+			)
+			# Keep the working data in the calibrated dtype, no-op if phasorpy already preserved it
+			dtype = self.real_calibrated.dtype
+			cached = (g.astype(dtype, copy=False), s.astype(dtype, copy=False))
+			if len(self._median_cache) >= self._MEDIAN_CACHE_SIZE:
+				# Evict the least recently used result
+				self._median_cache.pop(next(iter(self._median_cache)))
+		# (Re-)insert last to mark as most recently used
+		self._median_cache[key] = cached
+		self.g, self.s = cached
 
 	def update_photon_mask(self) -> None:
 		"""
 		Update mask based on current photon count threshold
 		"""
-		labels = self._photon_range_mask()
-		self.mask = (labels == 1)
+		# Kept pixels are min_count <= counts <= max_count. Fold the second comparison in place.
+		mask = self.counts >= self.min_count
+		mask &= self.counts <= self.max_count
+		self.mask = mask
 
 	def apply_photon_mask(self) -> None:
 		"""
 		Mask g and s using the photon count mask.
 		This turns the pixels outside the mask to nan.
 		"""
-		self.g[:,~self.mask] = np.nan; self.s[:,~self.mask] = np.nan
-		self.counts_filtered = self.counts.copy()
-		self.counts_filtered[~self.mask] = 0 # numpy int cannot be nan
+		outside = ~self.mask
+		if outside.any():
+			# g and s alias either the calibrated phasor (see reset_gs) or a cached median result,
+			# both of which must stay intact. Build the masked copies in a single pass instead.
+			# The (Y,X) mask broadcasts over the harmonic axis.
+			self.g = np.where(outside, np.nan, self.g)
+			self.s = np.where(outside, np.nan, self.s)
+		self.update_valid_index()
+		# Write into the existing buffer instead of allocating a new one every run.
+		# numpy int cannot be nan, so masked pixels become 0.
+		np.multiply(self.counts, self.mask, out=self.counts_filtered)
+
+	def update_valid_index(self) -> None:
+		"""
+		Cache the flat indices of pixels that are inside the photon mask
+		and have finite g and s at the fundamental frequency.
+		"""
+		g, s = self.get_phasor()
+		self.valid_idx = np.flatnonzero(self.mask & np.isfinite(g) & np.isfinite(s))
 
 	def reset_gs(self) -> None:
 		"""
 		Reset g and s to calibrated phasor.
+		g and s alias the calibrated arrays, apply_photon_mask copies them only if it has to write.
 		"""
-		self.g = self.real_calibrated.copy()
-		self.s = self.imag_calibrated.copy()
+		self.g = self.real_calibrated
+		self.s = self.imag_calibrated
 
 	## ------ Public API ------ ##
 	def get_phasor(self, harmonic:int=1):
@@ -137,19 +242,30 @@ class Dataset:
 		self.color = str2color(group)
 
 	def summarize(self) -> dict:
+		"""
+		Return dataset metadata and flattened per-pixel values.
+		The arrays are views into the dataset where possible, callers must not modify them.
+		"""
 		# TODO: Maybe find a way to standarize the property names
 		out = {}
 		out["name"] = self.name
 		out["channel"] = self.channel
 		out["group"] = self.group
-		out["photon_count"] = self.counts.flatten()
-		out["phi_lifetime"] = self.phase_lifetime.flatten()
-		out["m_lifetime"] = self.modulation_lifetime.flatten()
-		out["proj_lifetime"] = self.normal_lifetime.flatten()
+		out["photon_count"] = self.counts.ravel()
+		out["phi_lifetime"] = self.phase_lifetime.ravel()
+		out["m_lifetime"] = self.modulation_lifetime.ravel()
+		out["proj_lifetime"] = self.normal_lifetime.ravel()
 		return out
 
 	def pixel_values(self, metric:str, harmonic:int=1) -> np.ndarray:
-		"""Return 1D float array of valid pixel values for a metric."""
+		"""
+		Return 1D float array of valid pixel values for a metric.
+		The result is cached until the working data changes, callers must not modify it.
+		"""
+		key = (metric, harmonic)
+		cached = self._values_cache.get(key)
+		if cached is not None:
+			return cached
 		match metric:
 			case "photon_count":
 				vals = self.counts[self.mask].astype(float).ravel()
@@ -174,11 +290,13 @@ class Dataset:
 			case "geo_frac1":
 				vals =	self.geo_fraction[0].ravel()
 			case "geo_frac2":
-				vals = ds.geo_fraction[1].ravel()
+				vals = self.geo_fraction[1].ravel()
 			case _:
 				raise KeyError(metric)
 
-		return vals[np.isfinite(vals)]
+		vals = vals[np.isfinite(vals)]
+		self._values_cache[key] = vals
+		return vals
 
 	def image_feature(self, metric:str, stat:str, harmonic:int=1) -> float:
 		"""Compute one image-level feature = summary stat over pixel values."""
@@ -204,20 +322,13 @@ class Dataset:
 		return f"{self.name} (C{self.channel}) [{self.group}]"
 
 	## ------ Internal ------ ##
-	def _photon_sum(self) -> np.ndarray:
-		# Sum raw signal over time-axis => photon counts per pixel.
-		return self.signal.sum(dim='H').to_numpy()
+	def _median_enabled(self) -> bool:
+		return self.kernel_size >= 3 and self.repetition >= 1
 
-	def _photon_range_mask(self) -> np.ndarray:
-		"""
-		Return a labels mask (Y,X) with values: 0=low, 1=kept, 2=high.
-		"""
-		low = self.counts < self.min_count
-		high = self.counts > self.max_count
-		kept = ~(low|high)
-
-		labels = np.zeros_like(self.counts, dtype=np.uint8)
-		labels[kept] = 1
-		labels[high] = 2
-		return labels
+	def _photon_sum(self, signal:"xarray.DataArray") -> np.ndarray:
+		# Sum raw signal over time-axis => photon counts per pixel.
+		# Small unsigned counts fit in uint32, which halves the output compared to numpy's default uint64.
+		dtype = np.uint32 if signal.dtype.kind == "u" and signal.dtype.itemsize <= 2 else None
+		# Reduce the underlying ndarray directly, skipping xarray's reduction dispatch and result wrapping
+		return signal.values.sum(axis=signal.get_axis_num('H'), dtype=dtype)
 
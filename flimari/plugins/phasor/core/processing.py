@@ -1,7 +1,5 @@
 import numpy as np
 from typing import List, Tuple
-from scipy.ndimage import median_filter
-from phasorpy.cursor import mask_from_circular_cursor
 
 def labels_from_roi(
 	real: np.ndarray,
@@ -12,20 +10,21 @@ def labels_from_roi(
 	Return a indexed label mask with the same dimension as the sample image,
 	where the indices follow the order of the roi in roi_list.
 	Note that the returned labels are 1-based, since 0 is reserved for background.
+	Where rois overlap, the later roi in roi_list takes precedence.
 	"""
-	l_center_real = [roi.real for roi in roi_list]
-	l_center_imag = [roi.imag for roi in roi_list]
-	l_radius = [roi.radius for roi in roi_list]
-	# mask is a r x p 2d array where r is the number of rois and p is the length of real/imag.
-	masks = mask_from_circular_cursor(real, imag, l_center_real, l_center_imag, radius=l_radius)
-	# HACK: Given that the images are mostly likely equal width and height,
-	# we just take the sqrt of the total length and reshape it based on that
-	n, h, w = masks.shape
+	n = len(roi_list)
+	if n == 0:
+		return np.zeros(real.shape, dtype=np.uint8)
+	# Roi parameters shaped (n,1,...,1) to broadcast against the image.
+	# Keep them in the image dtype so the (n,Y,X) temporaries are not promoted.
+	shape = (-1,) + (1,)*real.ndim
+	center_real = np.asarray([roi.real for roi in roi_list], dtype=real.dtype).reshape(shape)
+	center_imag = np.asarray([roi.imag for roi in roi_list], dtype=real.dtype).reshape(shape)
+	radius_sq = np.asarray([roi.radius_sq for roi in roi_list], dtype=real.dtype).reshape(shape)
+	# inside is a n x (Y,X) boolean array, one membership mask per roi
+	inside = (real-center_real)**2 + (imag-center_imag)**2 <= radius_sq
 
-	# Build single integrated label mask
-	labels = np.zeros((h,w), dtype=np.uint8) # Up to 255 rois
-	for i in range(n):
-		# Each m is a 2d binary array mask
-		labels[masks[i]] = i+1
-
-	return labels
+	# Later rois have larger indices, so the max index of all containing rois is the label.
+	# Up to 255 rois
+	indices = np.arange(1, n+1, dtype=np.uint8).reshape(shape)
+	return (inside*indices).max(axis=0)
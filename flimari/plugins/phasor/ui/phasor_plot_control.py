@@ -1,4 +1,5 @@
 from typing import List, Dict, Any, TYPE_CHECKING
+from functools import lru_cache
 
 from qtpy.QtCore import Signal
 from qtpy.QtWidgets import (
@@ -19,6 +20,11 @@ import matplotlib.pyplot as plt
 if TYPE_CHECKING:
 	from ..core import Dataset
 
+@lru_cache(maxsize=1)
+def _colormap_names() -> tuple[str, ...]:
+	"""Registered matplotlib colormap names, looked up once per session."""
+	return tuple(plt.colormaps())
+
 class PhasorControlPanel(QGroupBox):
 	"""
 	Control panel for phasor graph.
@@ -56,10 +62,8 @@ class PhasorControlPanel(QGroupBox):
 		# Color map
 		cmap_label = QLabel("Color map")
 		self.cmap_combo_box = QComboBox()
-		self.cmap_combo_box.addItem("by group")
-		cmap_names = plt.colormaps()
-		for name in cmap_names:
-			self.cmap_combo_box.addItem(name)
+		# Bulk insert, one model update instead of one per colormap
+		self.cmap_combo_box.addItems(["by group", *_colormap_names()])
 		self.cmap_combo_box.setCurrentText("by group")
 		ctrl_grid.addWidget(cmap_label, 0, 2)
 		ctrl_grid.addWidget(self.cmap_combo_box, 0, 3)
@@ -76,21 +80,23 @@ class PhasorControlPanel(QGroupBox):
 		self.dataset_list = QListWidget()
 		self.dataset_list.setSelectionMode(self.dataset_list.ExtendedSelection)
 		self.dataset_list.setSpacing(0)
-		for ds in self._datasets:
-			list_item = QListWidgetItem(f"{ds.name} (channel {ds.channel})")
-			self.dataset_list.addItem(list_item)
-			# We want all datasets to be selected at the start
-			# because we will immediately plot them
-			list_item.setSelected(True)
 		self.dataset_list.itemSelectionChanged.connect(self._on_selection_changed)
-		self._on_selection_changed()
+		self._populate_dataset_list()
 		ctrl_grid.addWidget(self.dataset_list, 0, 4, 2, 1)
 
 	## ------ Public API ------ ##
+	def set_datasets(self, datasets:list["Dataset"]) -> None:
+		"""
+		Replace the datasets in the list. All of them start selected.
+		"""
+		self._datasets = datasets
+		self._populate_dataset_list()
+
 	def get_selected_datasets(self) -> list["Dataset"]:
 		return [
-			self._datasets[self.dataset_list.row(item)]
-			for item in self.dataset_list.selectedItems()
+			# selectedRows yields row numbers directly, QListWidget.row(item) is a linear search
+			self._datasets[index.row()]
+			for index in self.dataset_list.selectionModel().selectedRows()
 		]
 
 	def get_params(self) -> Dict[str,Any]:
@@ -105,6 +111,22 @@ class PhasorControlPanel(QGroupBox):
 		return params
 
 	## ------ Internal ------ ##
+	def _populate_dataset_list(self) -> None:
+		# Selecting each item would fire itemSelectionChanged once per dataset,
+		# so block it while (re)building and update the button state once afterwards.
+		self.dataset_list.blockSignals(True)
+		try:
+			self.dataset_list.clear()
+			for ds in self._datasets:
+				list_item = QListWidgetItem(f"{ds.name} (channel {ds.channel})")
+				self.dataset_list.addItem(list_item)
+				# We want all datasets to be selected at the start
+				# because we will immediately plot them
+				list_item.setSelected(True)
+		finally:
+			self.dataset_list.blockSignals(False)
+		self._on_selection_changed()
+
 	def _on_btn_draw_clicked(self) -> None:
 		self.plotPhasor.emit()
 
@@ -10,6 +10,7 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolb
 
 from phasorpy.plot import PhasorPlot
 
+from flimari.config import Defaults
 from flimari.core.widgets import MPLGraph
 
 if TYPE_CHECKING:
@@ -42,38 +43,31 @@ class PhasorGraphWidget(MPLGraph):
 			"magenta",
 			"red",
 		]
+		# Artists added by draw_dataset, removed by clear. Everything else is persistent.
+		self._data_artists: list = []
+		self._reset_axes()
 		self.draw_idle()
 
 	## ------ Public API ------ ##
-	def clear(self) -> None:
+	def set_frequency(self, frequency:float|None) -> None:
 		"""
-		Reset the plot.
+		Update the laser frequency, redrawing the title and semicircle if it changed.
 		"""
-		# This is nasty, but I don't think there is a more reliable way?
-		xlim = self._ax.get_xlim()
-		ylim = self._ax.get_ylim()
-		xscale = self._ax.get_xscale()
-		yscale = self._ax.get_yscale()
-		aspect = self._ax.get_aspect()
-		# HACK: Save the circle ROI patches before clearing and add back.
-		# This works, but not scalable once we add arrows, component analysis, etc.
-		patches = self._ax.patches[:]
-		self._ax.cla()
-		for p in patches:
-			self._ax.add_patch(p)
-		self._ax.set_xlim(xlim)
-		self._ax.set_ylim(ylim)
-		self._ax.set_xscale(xscale)
-		self._ax.set_yscale(yscale)
-		self._ax.set_aspect(aspect)
+		if frequency == self.frequency: return
+		self.frequency = frequency
+		self._reset_axes()
 
-		if self.frequency:
-			self._ax.set_title(f"Phasor plot ({self.frequency} MHz)")
-		else:
-			self._ax.set_title("Phasor plot")
-		self._ax.set_xlabel("G, real")
-		self._ax.set_ylabel("S, imag")
-		self._draw_semicircle()
+	def clear(self) -> None:
+		"""
+		Remove plotted datasets and the legend.
+		Axes decorations, the semicircle and ROI patches are kept as they are.
+		"""
+		for artist in self._data_artists:
+			artist.remove()
+		self._data_artists.clear()
+		legend = self._ax.get_legend()
+		if legend is not None:
+			legend.remove()
 
 	def draw_datasets(
 		self,
@@ -120,10 +114,18 @@ class PhasorGraphWidget(MPLGraph):
 		# Slice only meaningful values for efficient plotting
 		# TODO: Figure out exactly how to handle g s returns
 		g, s = dataset.get_phasor()
-		g = g[dataset.mask]
-		s = s[dataset.mask]
+		# Gather through the cached valid pixel indices instead of re-scanning the mask
+		g = g.ravel()[dataset.valid_idx]
+		s = s.ravel()[dataset.valid_idx]
+		# PhasorPlot does not consistently return what it draws, so diff the axes children instead
+		before = set(self._ax.get_children())
 		match mode:
 			case "scatter":
+				# Plot a random subset of large datasets, the points overplot each other anyway
+				if g.size > Defaults.max_phasor_points:
+					# Fixed seed, so redrawing the same dataset shows the same subset
+					idx = np.random.default_rng(0).choice(g.size, Defaults.max_phasor_points, replace=False)
+					g, s = g[idx], s[idx]
 				self._pp.plot(g, s, fmt=',', alpha = 0.5, color=dataset.color)
 			case "hist2d":
 				self._pp.hist2d(g, s, cmap=cmap)
@@ -132,8 +134,40 @@ class PhasorGraphWidget(MPLGraph):
 					self._pp.contour(g, s, colors=dataset.color)
 				else:
 					self._pp.contour(g, s, cmap=cmap)
+		self._data_artists.extend(a for a in self._ax.get_children() if a not in before)
 
 	## ------ Internal ------ ##
+	def _reset_axes(self) -> None:
+		"""
+		Clear the axes and redraw title, labels and semicircle, preserving view limits and ROI patches.
+		"""
+		# This is nasty, but I don't think there is a more reliable way?
+		xlim = self._ax.get_xlim()
+		ylim = self._ax.get_ylim()
+		xscale = self._ax.get_xscale()
+		yscale = self._ax.get_yscale()
+		aspect = self._ax.get_aspect()
+		# HACK: Save the circle ROI patches before clearing and add back.
+		# This works, but not scalable once we add arrows, component analysis, etc.
+		patches = self._ax.patches[:]
+		self._ax.cla()
+		for p in patches:
+			self._ax.add_patch(p)
+		self._ax.set_xlim(xlim)
+		self._ax.set_ylim(ylim)
+		self._ax.set_xscale(xscale)
+		self._ax.set_yscale(yscale)
+		self._ax.set_aspect(aspect)
+
+		if self.frequency:
+			self._ax.set_title(f"Phasor plot ({self.frequency} MHz)")
+		else:
+			self._ax.set_title("Phasor plot")
+		self._ax.set_xlabel("G, real")
+		self._ax.set_ylabel("S, imag")
+		self._draw_semicircle()
+		self._data_artists.clear()
+
 	def _draw_semicircle(self) -> None:
 		# We have to give it frequency here because apparently PhasorPlot does not
 		# keep track of the frequency value given in init.
@@ -1,30 +1,34 @@
 from __future__ import annotations
 from typing import Optional, List, Tuple, TYPE_CHECKING
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from matplotlib.patches import Circle
+from qtpy.QtCore import Slot
 from qtpy.QtWidgets import (
 	QWidget,
 	QHBoxLayout,
 	QVBoxLayout,
 	QLineEdit,
 	QLabel,
-	QDoubleSpinBox,
 	QPushButton,
 	QListWidget,
 	QListWidgetItem
 )
-from flimari.core.widgets import ThemedButton, ColorButton
+from flimari.core.widgets import ThemedButton, ColorButton, FocusDoubleSpinBox
 
 if TYPE_CHECKING:
 	from matplotlib.axes import Axes
 
-@dataclass
+@dataclass(slots=True)
 class Roi:
 	name: str # ROI name
 	real: float # center real
 	imag: float # center imaginary
 	radius: float # radius
 	color: str # Hex color string
+	radius_sq: float = field(init=False, repr=False) # radius squared, for distance checks
+
+	def __post_init__(self) -> None:
+		self.radius_sq = self.radius*self.radius
 
 class RoiRowWidget(QWidget):
 	"""
@@ -66,7 +70,7 @@ class RoiRowWidget(QWidget):
 		self.name_label.setMaximumWidth(60)
 		root.addWidget(self.name_label, stretch=1)
 
-		self.radius = QDoubleSpinBox()
+		self.radius = FocusDoubleSpinBox()
 		self.radius.setRange(0.01, 99.0)
 		self.radius.setSingleStep(0.01)
 		self.radius.setValue(init_radius)
@@ -130,11 +134,13 @@ class RoiRowWidget(QWidget):
 		self._ax.add_patch(self._circle)
 		self._draw_idle()
 
+	@Slot(float)
 	def _on_radius_changed(self, r: float) -> None:
 		if self._circle is not None:
 			self._circle.set_radius(r)
 			self._draw_idle()
 
+	@Slot(object)
 	def _on_color_changed(self, color:str) -> None:
 		"""Update circle color from ColorButton (expects hex color string)."""
 		self._color = color
@@ -189,6 +195,7 @@ class RoiManagerWidget(QWidget):
 		root.addWidget(self.roi_list)
 
 	## ------ Public API ------ ##
+	@Slot(float, float)
 	def move_selected_roi(self, real:float, imag:float) -> None:
 		"""
 		Updated the position of selected ROI.
@@ -65,6 +65,17 @@ class PhasorPlotWidget(QWidget):
 		# Connect ROI manager to the graph click signal
 		self.phasor_graph_widget.canvasClicked.connect(self.roi_manager.move_selected_roi)
 
+	## ------ Public API ------ ##
+	def set_datasets(self, datasets:list["Dataset"], frequency:float|None = None) -> None:
+		"""
+		Replace the plotted datasets and redraw. The figure and ROIs are kept.
+		"""
+		self._datasets = datasets
+		self.frequency = frequency
+		self.control_panel.set_datasets(datasets)
+		self.phasor_graph_widget.set_frequency(frequency)
+		self._on_plot_phasor()
+
 	## ------ Internal ------ ##
 	def _on_map_roi(self) -> None:
 		"""
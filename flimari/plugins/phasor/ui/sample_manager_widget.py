@@ -23,10 +23,12 @@ from qtpy.QtWidgets import (
 	QListWidgetItem,
 	QStyle
 )
+from napari.qt.threading import create_worker
+from napari.utils.notifications import show_error
 
-from flimari.core.napari import LayerManager
+from flimari.core.napari import LayerManager, LayerType
 from flimari.core.io import load_signal
-from flimari.core.widgets import ThemedButton, Indicator
+from flimari.core.widgets import ThemedButton, Indicator, FocusSpinBox
 from .phasor_plot_widget import PhasorPlotWidget
 from .summary_widget import SummaryWidget
 from .umap_widget import UMAPWidget
@@ -41,6 +43,8 @@ if TYPE_CHECKING:
 
 class DatasetRow(QWidget):
 	show_clicked = Signal()
+	# Dataset attribute shown in the layer for each lifetime_combo_box entry, in item order
+	_SHOW_ATTRS = ("counts_filtered", "phase_lifetime", "modulation_lifetime", "normal_lifetime", "avg_lifetime")
 
 	def __init__(
 		self,
@@ -52,8 +56,11 @@ class DatasetRow(QWidget):
 		self.name = dataset.name
 		self.dataset = dataset
 		self.viewer = viewer
+		self._layer_manager = LayerManager()
 		self._list: QListWidget|None = None
 		self._item: QListWidgetItem|None = None
+		# (combo box index, dataset data_version) last pushed to the viewer
+		self._last_shown: tuple[int,int]|None = None
 
 		self._build()
 		self._on_show()
@@ -68,7 +75,7 @@ class DatasetRow(QWidget):
 		# TODO: Change behavior of eye button
 		self.btn_show = ThemedButton(icon="visibility", viewer=self.viewer)
 		self.btn_show.setToolTip("Focus in layer viewer")
-		self.btn_show.clicked.connect(lambda : LayerManager().focus_on_layers(self.dataset.name))
+		self.btn_show.clicked.connect(lambda : self._layer_manager.focus_on_layers(self.dataset.name))
 		# Dropbox for selecting the lifetime to visualize
 		self.lifetime_combo_box = QComboBox()
 		self.lifetime_combo_box.setToolTip((
@@ -80,7 +87,7 @@ class DatasetRow(QWidget):
 		self.lifetime_combo_box.addItem("M")
 		self.lifetime_combo_box.addItem("proj")
 		self.lifetime_combo_box.addItem("avg")
-		self.lifetime_combo_box.currentIndexChanged.connect(lambda i : self._on_show())
+		self.lifetime_combo_box.currentIndexChanged.connect(self._on_show)
 		# Indicator for calibration status
 		self.indicator = Indicator()
 		self.indicator.set_state("bad")
@@ -127,21 +134,19 @@ class DatasetRow(QWidget):
 		self.deleteLater() # Delete the widget; let gc handle the list item
 		# TODO: Remove the associated layers?
 
-	def _on_show(self) -> None:
+	def _on_show(self, index:int|None = None) -> None:
 		if self.dataset is None:
 			raise RuntimeError(f"Sample {self.name} does not have a dataset")
+		if index is None:
+			index = self.lifetime_combo_box.currentIndex()
+		# Skip the push if the layer already shows this data, unless the user removed it
+		key = (index, self.dataset.data_version)
+		if key == self._last_shown and self._layer_manager.has_layer(self.dataset.name, LayerType.IMAGE):
+			return
 		# Show lifetime map
-		match self.lifetime_combo_box.currentText():
-			case "none":
-				LayerManager().add_image(self.dataset.counts_filtered, name=self.dataset.name, overwrite=True)
-			case "phi":
-				LayerManager().add_image(self.dataset.phase_lifetime, name=self.dataset.name, overwrite=True)
-			case "M":
-				LayerManager().add_image(self.dataset.modulation_lifetime, name=self.dataset.name, overwrite=True)
-			case "proj":
-				LayerManager().add_image(self.dataset.normal_lifetime, name=self.dataset.name, overwrite=True)
-			case "avg":
-				LayerManager().add_image(self.dataset.avg_lifetime, name=self.dataset.name, overwrite=True)
+		data = getattr(self.dataset, self._SHOW_ATTRS[index])
+		self._layer_manager.add_image(data, name=self.dataset.name, overwrite=True)
+		self._last_shown = key
 
 class SampleManagerWidget(QWidget):
 	def __init__(
@@ -160,6 +165,9 @@ class SampleManagerWidget(QWidget):
 		# Set up connect to update status od datasets
 		cal_widget.calibrationChanged.connect(self._mark_all_stale)
 		self.param_names: list[str] = ["min_count", "max_count", "kernel_size", "repetition"]
+		# The open phasor plot window, reused by later visualize requests
+		self._phasor_plot_widget: PhasorPlotWidget|None = None
+		self._phasor_plot_dock: QWidget|None = None
 
 		self._build()
 
@@ -202,10 +210,10 @@ class SampleManagerWidget(QWidget):
 		# Second row: photon count thresholding
 		min_count_label = QLabel("Min photon count")
 		max_count_label = QLabel("Max photon count")
-		self.min_count = QSpinBox()
+		self.min_count = FocusSpinBox()
 		self.min_count.setRange(0, int(1e9))
 		self.min_count.setValue(0)
-		self.max_count = QSpinBox()
+		self.max_count = FocusSpinBox()
 		self.max_count.setRange(1, int(1e9))
 		self.max_count.setValue(10000)
 		dataset_control_layout.addWidget(min_count_label, 2, 0)
@@ -215,10 +223,10 @@ class SampleManagerWidget(QWidget):
 		# Second row: median filter
 		kernel_size_label = QLabel("Median filter size")
 		repetition_label = QLabel("Median filter repetition")
-		self.kernel_size = QSpinBox()
+		self.kernel_size = FocusSpinBox()
 		self.kernel_size.setRange(2, 99)
 		self.kernel_size.setValue(3)
-		self.repetition = QSpinBox()
+		self.repetition = FocusSpinBox()
 		self.repetition.setRange(0, 99)
 		self.repetition.setValue(0)
 		dataset_control_layout.addWidget(kernel_size_label, 3, 0)
@@ -284,6 +292,7 @@ class SampleManagerWidget(QWidget):
 		Prompt for file selection, then load file as phasorpy signal.
 		Store the loaded signal as Dataset object along with metadata.
 		Then create a DatasetRow and insert into the list widget. 
+		Loading happens off the GUI thread, so rows appear in the order the files finish loading.
 		"""
 		paths, _ = QFileDialog.getOpenFileNames(
 			self,
@@ -293,14 +302,23 @@ class SampleManagerWidget(QWidget):
 		)
 		selected_channel = self.channel_selector.value()
 		for path in paths:
-			ds = Dataset(path=path, channel=selected_channel)
-
-			item = QListWidgetItem(self.dataset_list)
-			row = DatasetRow(ds, self.viewer)
-			row.bind(self.dataset_list, item) 
-			item.setSizeHint(row.sizeHint())
-			self.dataset_list.addItem(item)
-			self.dataset_list.setItemWidget(item, row)
+			# Decoding and phasor computation run on the global thread pool.
+			# Results are delivered back on the GUI thread, where the widgets are built.
+			worker = create_worker(Dataset, path=path, channel=selected_channel)
+			worker.returned.connect(self._add_dataset_row)
+			worker.errored.connect(lambda e, path=path: show_error(f"Failed to load {path}: {e}"))
+			worker.start()
+
+	def _add_dataset_row(self, ds:Dataset) -> None:
+		"""
+		Create a DatasetRow for a loaded dataset and insert it into the list widget.
+		"""
+		item = QListWidgetItem(self.dataset_list)
+		row = DatasetRow(ds, self.viewer)
+		row.bind(self.dataset_list, item) 
+		item.setSizeHint(row.sizeHint())
+		self.dataset_list.addItem(item)
+		self.dataset_list.setItemWidget(item, row)
 	
 	def _on_selection_changed(self) -> None:
 		"""
@@ -365,16 +383,33 @@ class SampleManagerWidget(QWidget):
 		"""
 		Take all selected datasets, filter for those that have phasor computed,
 		Instantiate a new PhasorPlorWidget instance and initialize with the datasets.
+		If a phasor plot window is already open, show the datasets there instead.
 		If no selected datasets have phasor, simply return.
 		"""
 		datasets = self.get_selected_datasets()
 		if len(datasets) <= 0: return
+		# Reuse the open window rather than building a new figure and canvas every time
+		if self._phasor_plot_widget is not None:
+			self._phasor_plot_widget.set_datasets(datasets, frequency=self.calibration.frequency)
+			self._phasor_plot_dock.show()
+			self._phasor_plot_dock.raise_()
+			return
 		# Make plot widget
 		phasor_plot_widget = PhasorPlotWidget(self.viewer, datasets, frequency=self.calibration.frequency)
 		# NOTE: For some reason, area="right" leads to layout problems of the canvas. I'm unsure why.
 		phasor_plot_dock = self.viewer.window.add_dock_widget(phasor_plot_widget, name="Phasor Plot", area="bottom")
 		phasor_plot_dock.setFloating(True)
 		phasor_plot_dock.setAllowedAreas(Qt.NoDockWidgetArea)
+		self._phasor_plot_widget = phasor_plot_widget
+		self._phasor_plot_dock = phasor_plot_dock
+		phasor_plot_dock.destroyed.connect(self._on_phasor_plot_closed)
+
+	def _on_phasor_plot_closed(self) -> None:
+		"""
+		Forget the phasor plot window once napari destroys its dock.
+		"""
+		self._phasor_plot_widget = None
+		self._phasor_plot_dock = None
 
 	def _on_btn_summary_clicked(self) -> None:
 		datasets = self.get_selected_datasets()
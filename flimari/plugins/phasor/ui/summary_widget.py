@@ -1,9 +1,6 @@
 from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT
 
 from qtpy.QtWidgets import (
 	QWidget,
@@ -85,8 +82,8 @@ class SummaryWidget(QWidget):
 	## ------ Public API ------ ##
 	def get_selected_datasets(self) -> list["Dataset"]:
 		return [
-			self._datasets[self.dataset_list.row(item)]
-			for item in self.dataset_list.selectedItems()
+			self._datasets[index.row()]
+			for index in self.dataset_list.selectionModel().selectedRows()
 		]
 
 	## ------ Internal ------ ##
@@ -100,16 +97,17 @@ class SummaryWidget(QWidget):
 		ax.set_xticks(np.arange(1, len(labels)+1), labels=labels)
 		self.graph.draw_idle()
 
-	def _make_data_for_plot(self, datasets:list["Dataset"]) -> None:
-		data = {}
+	def _make_data_for_plot(self, datasets:list["Dataset"]) -> dict[str,np.ndarray]:
+		stat = self.stats_combobox.currentText()
+		# Collect per group and concatenate once, instead of re-allocating the group array per dataset
+		chunks: dict[str,list[np.ndarray]] = {}
 		for ds in datasets:
 			summary = ds.summarize()
-			values = summary[self.stats_combobox.currentText()]
+			values = summary[stat]
 			# Filter out nan
-			values = values[~np.isnan(values)]
-			group = summary["group"]
-			data[group] = np.append(data.get(group, np.array([])), values)
-		return data
+			values = values[np.isfinite(values)]
+			chunks.setdefault(summary["group"], []).append(values)
+		return {group: np.concatenate(arrs) for group, arrs in chunks.items()}
 
 	def _on_btn_clear_clicked(self) -> None:
 		self.graph.clear()
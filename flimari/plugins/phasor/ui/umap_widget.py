@@ -290,8 +290,8 @@ class UMAPWidget(QWidget):
 
 	def get_selected_datasets(self) -> list["Dataset"]:
 		return [
-			self._datasets[self.dataset_list.row(item)]
-			for item in self.dataset_list.selectedItems()
+			self._datasets[index.row()]
+			for index in self.dataset_list.selectionModel().selectedRows()
 		]
 
 	## ------ Internal ------ ##
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("phasorpy")
+# Importing the plugin package registers its docks, which needs napari
+pytest.importorskip("napari")
+xr = pytest.importorskip("xarray")
+
+from flimari.plugins.phasor.core import dataset as dataset_module
+from flimari.plugins.phasor.core.dataset import Dataset
+
+@pytest.fixture
+def median_calls(monkeypatch):
+	"""
+	Record the (size, repeat) of every median filter run, delegating to phasorpy.
+	"""
+	calls = []
+	median = dataset_module.phasor_filter_median
+	def counting_median(*args, **kwargs):
+		calls.append((kwargs["size"], kwargs["repeat"]))
+		return median(*args, **kwargs)
+	monkeypatch.setattr(dataset_module, "phasor_filter_median", counting_median)
+	return calls
+
+@pytest.fixture
+def ds(tmp_path, monkeypatch, median_calls):
+	"""
+	Dataset backed by a small synthetic signal instead of a real FLIM file.
+	"""
+	rng = np.random.default_rng(0)
+	counts = rng.poisson(10, size=(16, 16, 32)).astype(np.uint16)
+	signal = xr.DataArray(counts, dims=("Y", "X", "H"), attrs={"frequency": 80.0})
+	monkeypatch.setattr(dataset_module, "load_signal", lambda path, channel: signal)
+	path = tmp_path / "synthetic.ptu"
+	path.touch()
+	ds = Dataset(path, 0)
+	ds.apply_filters()
+	return ds
+
+def test_apply_filters_skips_unchanged_parameters(ds):
+	version = ds.data_version
+	ds.apply_filters()
+	assert ds.data_version == version
+
+def test_apply_filters_skips_when_working_data_is_unchanged(ds):
+	version = ds.data_version
+	# Kernel size alone does nothing while the filter is off
+	ds.kernel_size = 5
+	ds.apply_filters()
+	assert ds.data_version == version
+	# No pixel crosses the new upper threshold
+	ds.max_count = ds.counts.max() + 100
+	ds.apply_filters()
+	assert ds.data_version == version
+
+def test_apply_filters_recomputes_on_mask_change(ds):
+	version = ds.data_version
+	ds.min_count = int(np.median(ds.counts))
+	ds.apply_filters()
+	assert ds.data_version == version + 1
+	assert np.isnan(ds.g[:, ~ds.mask]).all()
+	assert np.isfinite(ds.g[:, ds.mask]).all()
+
+def test_median_filter_reuses_recent_results(ds, median_calls):
+	ds.repetition = 1
+	ds.kernel_size = 3
+	ds.apply_filters()
+	ds.kernel_size = 5
+	ds.apply_filters()
+	assert median_calls == [(3, 1), (5, 1)]
+	# Switching back to a recent setting, or only changing the threshold, does not refilter
+	ds.kernel_size = 3
+	ds.apply_filters()
+	ds.min_count = int(np.median(ds.counts))
+	ds.apply_filters()
+	assert median_calls == [(3, 1), (5, 1)]
+	assert np.isnan(ds.g[:, ~ds.mask]).all()
+
+def test_disabling_median_filter_restores_calibrated_phasor(ds, median_calls):
+	ds.repetition = 1
+	ds.apply_filters()
+	version = ds.data_version
+	ds.repetition = 0
+	ds.apply_filters()
+	assert ds.data_version == version + 1
+	np.testing.assert_array_equal(ds.g, ds.real_calibrated)
+	np.testing.assert_array_equal(ds.s, ds.imag_calibrated)
+	# Re-enabling the filter after it was switched off refilters
+	ds.repetition = 1
+	ds.apply_filters()
+	assert len(median_calls) == 2
+
+def test_recalibration_refilters(ds, median_calls):
+	class IdentityCalibration:
+		frequency = 0.0
+		def compute_calibrated_phasor(self, real, imag):
+			return real.copy(), imag.copy()
+
+	ds.repetition = 1
+	ds.apply_filters()
+	version = ds.data_version
+	ds.calibrate_phasor(IdentityCalibration())
+	assert ds.data_version == version + 1
+	assert median_calls == [(ds.kernel_size, 1)] * 2
+	assert ds.g.dtype == np.float32